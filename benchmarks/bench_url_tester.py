@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+URL测试器基准测试
+针对本地镜像模拟器逐场景运行 run_url_tester，输出机器可读的性能指标，
+并支持与历史基准结果对比以发现性能回退。
+
+用法:
+    python benchmarks/bench_url_tester.py --output bench.json
+    python benchmarks/bench_url_tester.py --scenarios fast,timeout --compare bench.json
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).parent.absolute()
+SRC_DIR = BENCH_DIR.parent / "src"
+sys.path.insert(0, str(BENCH_DIR))
+
+from mirror_simulator import BEHAVIORS, MirrorSimulator, write_workspace  # noqa: E402
+
+# 场景名 -> 镜像行为列表（每个站点的镜像按列表循环分配行为）
+SCENARIOS = {name: [name] for name in BEHAVIORS}
+SCENARIOS['fast_https'] = ['fast_https']
+SCENARIOS['mixed'] = ['fast', 'slow_ttfb', 'forbidden_then_ok', 'no_keyword', 'refused', 'fast_https']
+
+# 越大越好的指标，其余指标越小越好
+HIGHER_IS_BETTER = {'probes_per_sec'}
+COMPARED_METRICS = ['wall_time', 'probes_per_sec', 'cpu_time', 'peak_rss_kb']
+
+
+def _peak_rss_kb():
+    """当前进程的峰值常驻内存(KB)，平台不支持时返回None"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS 返回字节，Linux 返回KB
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def run_child(workspace: str, result_file: str):
+    """子进程入口：在独立进程中运行URL测试器，保证峰值内存按场景统计"""
+    sys.path.insert(0, str(SRC_DIR))
+    from pan_site_monitor import PanSiteMonitor
+
+    config_file = os.path.join(workspace, 'config', 'app_config.json')
+
+    with open(os.devnull, 'w', encoding='utf-8') as devnull:
+        stdout = sys.stdout
+        sys.stdout = devnull
+        try:
+            cpu_start = time.process_time()
+            wall_start = time.perf_counter()
+            monitor = PanSiteMonitor(config_file, base_dir=workspace)
+            results = monitor.run_url_tester()
+            wall_time = time.perf_counter() - wall_start
+            cpu_time = time.process_time() - cpu_start
+        finally:
+            sys.stdout = stdout
+
+    probes = sum(len(result.get('url_results', {})) for result in results.values())
+    valid = sum(
+        1 for result in results.values()
+        for url_result in result.get('url_results', {}).values()
+        if url_result.ok
+    )
+
+    metrics = {
+        'wall_time': round(wall_time, 4),
+        'cpu_time': round(cpu_time, 4),
+        'probes': probes,
+        'valid_urls': valid,
+        'probes_per_sec': round(probes / wall_time, 3) if wall_time > 0 else None,
+        'peak_rss_kb': _peak_rss_kb(),
+    }
+    with open(result_file, 'w', encoding='utf-8') as f:
+        json.dump(metrics, f)
+
+
+def build_scenario(simulator: MirrorSimulator, scenario: str, run_id: str, sites: int, mirrors: int):
+    """为场景生成 data/test.json 格式的站点URL映射"""
+    behaviors = SCENARIOS[scenario]
+    site_urls = {}
+    for site_index in range(sites):
+        urls = []
+        for mirror_index in range(mirrors):
+            behavior = behaviors[(site_index * mirrors + mirror_index) % len(behaviors)]
+            mirror_id = f"{run_id}-{site_index}-{mirror_index}"
+            if behavior == 'fast_https':
+                urls.append(simulator.mirror_url('fast', mirror_id, https=True))
+            else:
+                urls.append(simulator.mirror_url(behavior, mirror_id))
+        site_urls[f"bench-{scenario}-{site_index}"] = urls
+    return site_urls
+
+
+def run_scenario(simulator: MirrorSimulator, scenario: str, args, repeat_index: int):
+    """运行单个场景一次，返回指标字典"""
+    workspace = tempfile.mkdtemp(prefix=f"bench_{scenario}_") if not args.workspace \
+        else os.path.join(args.workspace, scenario)
+    run_id = f"{scenario}-{repeat_index}-{int(time.time() * 1000)}"
+    site_urls = build_scenario(simulator, scenario, run_id, args.sites, args.mirrors)
+    write_workspace(workspace, site_urls, url_tester={
+        'test_timeout': args.timeout,
+        'rate_limit': {'rate': args.rate},
+    })
+
+    requests_before = simulator.request_counts()
+    result_file = os.path.join(workspace, 'bench_result.json')
+    subprocess.run(
+        [sys.executable, __file__, '--child', '--workspace', workspace, '--result', result_file],
+        check=True
+    )
+    requests_after = simulator.request_counts()
+
+    with open(result_file, 'r', encoding='utf-8') as f:
+        metrics = json.load(f)
+    metrics['requests'] = sum(requests_after.values()) - sum(requests_before.values())
+    if not args.workspace:
+        shutil.rmtree(workspace, ignore_errors=True)
+    return metrics
+
+
+def aggregate(runs):
+    """多次运行取中位数，避免偶发抖动"""
+    if len(runs) == 1:
+        return runs[0]
+    merged = {}
+    for key in runs[0]:
+        values = [run[key] for run in runs if isinstance(run.get(key), (int, float))]
+        if values:
+            values.sort()
+            merged[key] = values[len(values) // 2]
+        else:
+            merged[key] = runs[0][key]
+    merged['runs'] = len(runs)
+    return merged
+
+
+def compare(current, baseline_file: str, threshold: float):
+    """与基准结果对比，返回回退项列表"""
+    with open(baseline_file, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+
+    regressions = []
+    for scenario, metrics in current['scenarios'].items():
+        old = baseline.get('scenarios', {}).get(scenario)
+        if not old:
+            continue
+        for metric in COMPARED_METRICS:
+            new_value, old_value = metrics.get(metric), old.get(metric)
+            if not new_value or not old_value:
+                continue
+            change = (new_value - old_value) / old_value
+            worse = change < -threshold if metric in HIGHER_IS_BETTER else change > threshold
+            status = "回退" if worse else "持平"
+            if worse:
+                regressions.append({'scenario': scenario, 'metric': metric,
+                                    'baseline': old_value, 'current': new_value,
+                                    'change': round(change, 4)})
+            print(f"  {scenario:18s} {metric:15s} {old_value:>12} -> {new_value:>12} ({change:+.1%}) {status}",
+                  file=sys.stderr)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='URL测试器基准测试（本地镜像模拟器）')
+    parser.add_argument('--scenarios', default='all',
+                        help=f"逗号分隔的场景列表，可选: {', '.join(SCENARIOS)}，默认all")
+    parser.add_argument('--sites', type=int, default=2, help='每个场景的站点数')
+    parser.add_argument('--mirrors', type=int, default=3, help='每个站点的镜像数')
+    parser.add_argument('--repeat', type=int, default=1, help='每个场景重复次数（取中位数）')
+    parser.add_argument('--timeout', type=float, default=2, help='url_tester.test_timeout(秒)')
+    parser.add_argument('--rate', type=float, default=1.25,
+                        help='url_tester.rate_limit.rate（每个主机每秒请求数，0为不限速）')
+    parser.add_argument('--workspace', default=None, help='保留生成的工作目录（默认使用临时目录）')
+    parser.add_argument('--output', default=None, help='结果JSON输出路径（默认输出到标准输出）')
+    parser.add_argument('--compare', default=None, help='与之前的结果JSON对比')
+    parser.add_argument('--threshold', type=float, default=0.1, help='判定回退的相对变化阈值')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--result', default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.workspace, args.result)
+        return
+
+    scenarios = list(SCENARIOS) if args.scenarios == 'all' else args.scenarios.split(',')
+    unknown = [name for name in scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"未知场景: {', '.join(unknown)}")
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'sites': args.sites,
+            'mirrors': args.mirrors,
+            'repeat': args.repeat,
+            'timeout': args.timeout,
+            'rate': args.rate,
+        },
+        'scenarios': {}
+    }
+
+    with MirrorSimulator(hang_limit=args.timeout * 4) as simulator:
+        for scenario in scenarios:
+            if 'fast_https' in SCENARIOS[scenario] and simulator.https_port is None:
+                print(f"跳过场景 {scenario}: HTTPS模拟器不可用", file=sys.stderr)
+                continue
+            runs = [run_scenario(simulator, scenario, args, index) for index in range(args.repeat)]
+            metrics = aggregate(runs)
+            report['scenarios'][scenario] = metrics
+            print(f"{scenario:18s} wall={metrics['wall_time']:.2f}s "
+                  f"probes/s={metrics['probes_per_sec']} cpu={metrics['cpu_time']:.2f}s "
+                  f"rss={metrics['peak_rss_kb']}KB requests={metrics['requests']}", file=sys.stderr)
+
+    exit_code = 0
+    if args.compare:
+        print(f"\n与基准 {args.compare} 对比:", file=sys.stderr)
+        regressions = compare(report, args.compare, args.threshold)
+        report['regressions'] = regressions
+        exit_code = 1 if regressions else 0
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output)
+        print(f"结果已保存到: {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Mirror Simulator - 本地镜像站模拟器
+在本机启动HTTP/HTTPS替身服务器，模拟各类镜像站行为，供基准测试和规模测试使用
+"""
+import copy
+import json
+import os
+import shutil
+import socket
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+# 与 config/app_config.yml 中 keyword_validation 一致的关键字
+KEYWORD = 'class="search-stat"'
+SEARCH_PATH = "/index.php/vod/search.html?wd=bench"
+
+# 支持的镜像行为
+BEHAVIORS = [
+    'fast',               # 立即返回包含关键字的页面
+    'slow_ttfb',          # 首字节延迟
+    'slow_body',          # 响应头立即返回，响应体缓慢分块发送
+    'timeout',            # 挂起直到客户端超时
+    'forbidden_then_ok',  # 首次请求返回403，之后返回200
+    'rate_limited',       # 首次请求返回429并携带Retry-After，之后返回200
+    'no_keyword',         # 返回200但不包含关键字
+    'refused',            # 端口无监听，连接被拒绝
+    'huge_body',          # 超大响应体，关键字位于末尾
+]
+
+
+def _page(with_keyword: bool = True, padding: int = 0) -> bytes:
+    """生成模拟的搜索结果页面"""
+    filler = ("<p>" + "仙台有树" * 16 + "</p>\n") * max(padding // 200, 0)
+    marker = f'<div {KEYWORD}>搜索结果</div>' if with_keyword else '<div>暂无内容</div>'
+    return f"<html><head><title>bench</title></head><body>{filler}{marker}</body></html>".encode('utf-8')
+
+
+class _MirrorHandler(BaseHTTPRequestHandler):
+    """根据路径首段分派镜像行为: /<behavior>/<mirror_id>/..."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        # 静默访问日志，避免干扰基准测试输出
+        pass
+
+    def do_GET(self):
+        simulator = self.server.simulator
+        parts = self.path.lstrip('/').split('/', 2)
+        behavior = parts[0] if parts else ''
+        mirror_id = parts[1] if len(parts) > 1 else ''
+        attempt = simulator.record_request(behavior, mirror_id)
+        options = simulator.options
+
+        if behavior == 'fast':
+            self._send(200, _page())
+        elif behavior == 'slow_ttfb':
+            time.sleep(options['ttfb_delay'])
+            self._send(200, _page())
+        elif behavior == 'slow_body':
+            self._send_slow_body(_page(padding=4096), options['body_delay'])
+        elif behavior == 'timeout':
+            # 挂起直到模拟器停止或达到上限，由客户端超时结束请求
+            simulator.stop_event.wait(options['hang_limit'])
+            self._send(200, _page())
+        elif behavior == 'forbidden_then_ok':
+            self._send(403 if attempt == 1 else 200, _page(attempt != 1))
+        elif behavior == 'rate_limited':
+            if attempt == 1:
+                self._send(429, b'Too Many Requests', {'Retry-After': str(options['retry_after'])})
+            else:
+                self._send(200, _page())
+        elif behavior == 'no_keyword':
+            self._send(200, _page(with_keyword=False))
+        elif behavior == 'huge_body':
+            self._send(200, simulator.huge_body)
+        else:
+            self._send(404, b'Not Found')
+
+    def _send(self, status: int, body: bytes, headers: Optional[Dict[str, str]] = None):
+        try:
+            self.send_response(status)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError, ssl.SSLError):
+            pass
+
+    def _send_slow_body(self, body: bytes, total_delay: float, chunks: int = 10):
+        try:
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            step = max(len(body) // chunks, 1)
+            for offset in range(0, len(body), step):
+                self.wfile.write(body[offset:offset + step])
+                self.wfile.flush()
+                time.sleep(total_delay / chunks)
+        except (BrokenPipeError, ConnectionResetError, ssl.SSLError):
+            pass
+
+
+class MirrorSimulator:
+    """本地镜像站模拟器，同时提供HTTP和（可用时）HTTPS端点"""
+
+    def __init__(self, ttfb_delay: float = 0.5, body_delay: float = 1.0, hang_limit: float = 60,
+                 retry_after: int = 1, huge_body_size: int = 8 * 1024 * 1024, enable_https: bool = True):
+        self.options = {
+            'ttfb_delay': ttfb_delay,
+            'body_delay': body_delay,
+            'hang_limit': hang_limit,
+            'retry_after': retry_after,
+        }
+        self.huge_body = _page(padding=huge_body_size)
+        self.enable_https = enable_https
+        self.stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._attempts: Dict[tuple, int] = {}
+        self._request_counts: Dict[str, int] = {}
+        self._servers: List[ThreadingHTTPServer] = []
+        self._threads: List[threading.Thread] = []
+        self._cert_dir = None
+        self.http_port = None
+        self.https_port = None
+        self.refused_port = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def start(self):
+        """启动模拟服务器"""
+        self.http_port = self._serve(None)
+        if self.enable_https:
+            context = self._build_ssl_context()
+            if context is not None:
+                self.https_port = self._serve(context)
+        self.refused_port = self._find_closed_port()
+
+    def stop(self):
+        """停止模拟服务器并清理证书"""
+        self.stop_event.set()
+        for server in self._servers:
+            server.shutdown()
+            server.server_close()
+        for thread in self._threads:
+            thread.join(timeout=5)
+        self._servers.clear()
+        self._threads.clear()
+        if self._cert_dir:
+            shutil.rmtree(self._cert_dir, ignore_errors=True)
+            self._cert_dir = None
+
+    def record_request(self, behavior: str, mirror_id: str) -> int:
+        """记录请求并返回该镜像的第几次请求"""
+        with self._lock:
+            key = (behavior, mirror_id)
+            self._attempts[key] = self._attempts.get(key, 0) + 1
+            self._request_counts[behavior] = self._request_counts.get(behavior, 0) + 1
+            return self._attempts[key]
+
+    def request_counts(self) -> Dict[str, int]:
+        """返回各行为收到的请求数快照"""
+        with self._lock:
+            return dict(self._request_counts)
+
+    def mirror_url(self, behavior: str, mirror_id: str, https: bool = False) -> str:
+        """生成指定行为的镜像基础URL"""
+        if behavior == 'refused':
+            return f"http://127.0.0.1:{self.refused_port}/refused/{mirror_id}"
+        if https:
+            if self.https_port is None:
+                raise RuntimeError("HTTPS模拟器不可用（需要openssl生成自签名证书）")
+            return f"https://localhost:{self.https_port}/{behavior}/{mirror_id}"
+        return f"http://127.0.0.1:{self.http_port}/{behavior}/{mirror_id}"
+
+    def _serve(self, ssl_context: Optional[ssl.SSLContext]) -> int:
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _MirrorHandler)
+        server.daemon_threads = True
+        server.simulator = self
+        if ssl_context is not None:
+            server.socket = ssl_context.wrap_socket(server.socket, server_side=True)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self._servers.append(server)
+        self._threads.append(thread)
+        return server.server_address[1]
+
+    def _build_ssl_context(self) -> Optional[ssl.SSLContext]:
+        """使用openssl生成临时自签名证书"""
+        openssl = shutil.which('openssl')
+        if not openssl:
+            return None
+        self._cert_dir = tempfile.mkdtemp(prefix='mirror_sim_')
+        cert_file = os.path.join(self._cert_dir, 'cert.pem')
+        key_file = os.path.join(self._cert_dir, 'key.pem')
+        try:
+            subprocess.run(
+                [openssl, 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+                 '-subj', '/CN=localhost', '-keyout', key_file, '-out', cert_file],
+                check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=30
+            )
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(cert_file, key_file)
+            return context
+        except (OSError, subprocess.SubprocessError, ssl.SSLError):
+            return None
+
+    @staticmethod
+    def _find_closed_port() -> int:
+        """获取一个当前无监听的本地端口"""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(('127.0.0.1', 0))
+            return sock.getsockname()[1]
+
+
+def write_workspace(workdir: str, site_urls: Dict[str, List[str]], url_tester: Optional[dict] = None,
+                    history: Optional[dict] = None) -> str:
+    """生成与项目根目录结构一致的工作目录（配置、数据源及可选的历史记录），返回配置文件路径"""
+    repo_config = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                               'config', 'app_config.json')
+    with open(repo_config, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+
+    config = copy.deepcopy(config)
+    config['sites'] = {
+        'mapping': {f"bench{index}.json": name for index, name in enumerate(site_urls)},
+        'search_paths': {name: SEARCH_PATH for name in site_urls},
+        'keyword_validation': {name: KEYWORD for name in site_urls},
+    }
+    config['url_tester'].update(url_tester or {})
+    config['security']['verify_ssl'] = False
+    config['security']['ignore_ssl_warnings'] = True
+
+    config_dir = os.path.join(workdir, 'config')
+    data_dir = os.path.join(workdir, 'data')
+    os.makedirs(config_dir, exist_ok=True)
+    os.makedirs(data_dir, exist_ok=True)
+
+    config_file = os.path.join(config_dir, 'app_config.json')
+    with open(config_file, 'w', encoding='utf-8') as f:
+        json.dump(config, f, ensure_ascii=False, indent=2)
+
+    with open(os.path.join(data_dir, 'test.json'), 'w', encoding='utf-8') as f:
+        json.dump(site_urls, f, ensure_ascii=False, indent=2)
+
+    monitor_file = os.path.join(workdir, 'web', 'assets', 'data', 'monitor_data.json')
+    if history is not None:
+        os.makedirs(os.path.dirname(monitor_file), exist_ok=True)
+        with open(monitor_file, 'w', encoding='utf-8') as f:
+            json.dump({"history": history}, f, ensure_ascii=False, indent=2)
+    elif os.path.exists(monitor_file):
+        os.remove(monitor_file)
+
+    return config_file
+
+
+if __name__ == "__main__":
+    # 手动调试：启动模拟器并打印各行为的示例URL
+    with MirrorSimulator() as simulator:
+        for name in BEHAVIORS:
+            print(f"{name:18s} {simulator.mirror_url(name, 'demo')}{SEARCH_PATH}")
+        if simulator.https_port:
+            print(f"{'fast (https)':18s} {simulator.mirror_url('fast', 'demo', https=True)}{SEARCH_PATH}")
+        print("按 Ctrl+C 停止")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
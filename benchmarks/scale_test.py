@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+规模测试生成器
+合成大规模 data/test.json 与多周历史记录，端到端驱动 URL提取、历史记录加载、探测（本地镜像模拟器）、
+快照构建、update_history、save_monitor_data 以及上传请求体构建，
+报告各阶段耗时与内存随规模的变化。上一轮 monitor_data.json 每次运行只解析一次，
+单独计入 load_history 阶段，之后的探测、快照构建和 update_history 复用已解析的状态。
+
+用法:
+    python benchmarks/scale_test.py --scales 10x4,100x10,300x20 --history-weeks 2 --output scale.json
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).parent.absolute()
+SRC_DIR = BENCH_DIR.parent / "src"
+sys.path.insert(0, str(BENCH_DIR))
+sys.path.insert(0, str(SRC_DIR))
+
+from mirror_simulator import MirrorSimulator, write_workspace  # noqa: E402
+from pan_site_monitor import PanSiteMonitor, ProbeResult  # noqa: E402
+
+
+def parse_scales(value: str):
+    """解析 "站点数x镜像数" 列表，例如 10x4,100x10"""
+    scales = []
+    for item in value.split(','):
+        sites, _, mirrors = item.strip().lower().partition('x')
+        scales.append((int(sites), int(mirrors or 1)))
+    return scales
+
+
+def synthesize_sources(simulator: MirrorSimulator, sites: int, mirrors: int, fail_ratio: float, rng: random.Random):
+    """合成 data/test.json 格式的站点URL映射，部分镜像返回无关键字页面"""
+    site_urls = {}
+    for site_index in range(sites):
+        urls = []
+        for mirror_index in range(mirrors):
+            behavior = 'no_keyword' if rng.random() < fail_ratio else 'fast'
+            urls.append(simulator.mirror_url(behavior, f"scale-{site_index}-{mirror_index}"))
+        site_urls[f"scale-site-{site_index:04d}"] = urls
+    return site_urls
+
+
+def synthesize_history(site_urls, points: int, fail_ratio: float, rng: random.Random):
+    """合成按小时记录的多周历史数据，格式与 update_history 输出一致"""
+    now = datetime.now()
+    timestamps = [(now - timedelta(hours=points - index)).isoformat() for index in range(points)]
+    history = {}
+    for site_name, urls in site_urls.items():
+        site_history = {}
+        for url_index, url in enumerate(urls):
+            records = []
+            for timestamp in timestamps:
+                up = rng.random() >= fail_ratio
+                record = {
+                    "timestamp": timestamp,
+                    "status": "up" if up else "down",
+                    "latency": round(rng.uniform(0.1, 2.0), 6) if up else None,
+                    "is_best": up and url_index == 0
+                }
+                if not up:
+                    record["error_detail"] = "连接失败"
+                records.append(record)
+            site_history[url] = records
+        history[site_name] = site_history
+    return history
+
+
+class StageRecorder:
+    """记录各阶段的墙钟时间、CPU时间和内存分配峰值"""
+
+    def __init__(self, trace_memory: bool = True):
+        self.trace_memory = trace_memory
+        self.stages = {}
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        if self.trace_memory:
+            tracemalloc.start()
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            metrics = {
+                'seconds': round(time.perf_counter() - wall_start, 4),
+                'cpu_seconds': round(time.process_time() - cpu_start, 4),
+            }
+            if self.trace_memory:
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                metrics['peak_mb'] = round(peak / (1024 * 1024), 2)
+            self.stages[name] = metrics
+
+
+def run_scale(simulator: MirrorSimulator, sites: int, mirrors: int, args, rng: random.Random):
+    """在独立工作目录中按给定规模端到端运行一次"""
+    workspace = tempfile.mkdtemp(prefix=f"scale_{sites}x{mirrors}_")
+    recorder = StageRecorder(trace_memory=not args.no_tracemalloc)
+    history_points = args.history_weeks * 7 * 24
+
+    try:
+        with recorder.stage('generate_inputs'):
+            site_urls = synthesize_sources(simulator, sites, mirrors, args.fail_ratio, rng)
+            history = synthesize_history(site_urls, history_points, args.fail_ratio, rng) \
+                if history_points else None
+            config_file = write_workspace(workspace, site_urls, url_tester={
+                'test_timeout': args.timeout,
+                'rate_limit': {'rate': 0},
+                'history_limit': max(history_points, 1),
+            }, history=history)
+            del history
+
+        with open(os.devnull, 'w', encoding='utf-8') as devnull, contextlib.redirect_stdout(devnull):
+            with recorder.stage('init'):
+                monitor = PanSiteMonitor(config_file, base_dir=workspace)
+
+            with recorder.stage('extract'):
+                extracted_urls = monitor.extract_urls_from_sources()
+
+            # 历史记录在首次使用时才解析，显式计时，避免计入探测或快照构建阶段
+            with recorder.stage('load_history'):
+                monitor._load_previous_state()
+
+            if args.skip_probe:
+                results = {
+                    site_name: {'best_url': urls[0], 'url_results': {
+                        url: ProbeResult(url, site_name, 0.2, True) for url in urls
+                    }}
+                    for site_name, urls in extracted_urls.items()
+                }
+            else:
+                with recorder.stage('probe'):
+                    results = monitor.probe_sites(extracted_urls)
+
+            with recorder.stage('build_snapshot'):
+                snapshot = monitor.build_snapshot(results)
+
+            with recorder.stage('update_history'):
+                history_data = monitor.update_history(results, extracted_urls)
+
+            with recorder.stage('save_monitor_data'):
+                monitor.save_monitor_data(snapshot, history_data)
+
+            monitor_file = Path(workspace) / "web" / "assets" / "data" / "monitor_data.json"
+            with recorder.stage('upload_payload'):
+                payload = monitor.build_upload_payload(monitor_file, "web/assets/data/monitor_data.json")
+                payload_bytes = len(json.dumps(payload))
+
+        urls = sum(len(url_list) for url_list in extracted_urls.values())
+        return {
+            'sites': sites,
+            'mirrors': mirrors,
+            'urls': urls,
+            'history_points': history_points,
+            'stages': recorder.stages,
+            'sizes': {
+                'test_json_bytes': (Path(workspace) / "data" / "test.json").stat().st_size,
+                'monitor_data_bytes': monitor_file.stat().st_size,
+                'upload_payload_bytes': payload_bytes,
+            },
+        }
+    finally:
+        shutil.rmtree(workspace, ignore_errors=True)
+
+
+def scaling_summary(scales):
+    """计算各阶段每个URL的平均耗时，便于观察非线性增长"""
+    summary = {}
+    for entry in scales:
+        for stage, metrics in entry['stages'].items():
+            per_url = metrics['seconds'] / entry['urls'] * 1000 if entry['urls'] else None
+            summary.setdefault(stage, []).append({
+                'urls': entry['urls'],
+                'ms_per_url': round(per_url, 4) if per_url is not None else None,
+                'peak_mb': metrics.get('peak_mb'),
+            })
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description='规模测试：合成大规模站点/镜像/历史并分阶段计时')
+    parser.add_argument('--scales', default='10x4,50x10,200x10', help='逗号分隔的"站点数x镜像数"列表')
+    parser.add_argument('--history-weeks', type=int, default=1, help='合成历史的周数（每小时一个点）')
+    parser.add_argument('--fail-ratio', type=float, default=0.1, help='失败镜像和历史离线点的比例')
+    parser.add_argument('--timeout', type=float, default=5, help='url_tester.test_timeout(秒)')
+    parser.add_argument('--skip-probe', action='store_true', help='跳过真实探测，使用合成的探测结果')
+    parser.add_argument('--no-tracemalloc', action='store_true', help='不统计内存峰值（减少计时干扰）')
+    parser.add_argument('--seed', type=int, default=42, help='随机数种子')
+    parser.add_argument('--output', default=None, help='结果JSON输出路径（默认输出到标准输出）')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'history_weeks': args.history_weeks,
+            'fail_ratio': args.fail_ratio,
+            'skip_probe': args.skip_probe,
+            'tracemalloc': not args.no_tracemalloc,
+        },
+        'scales': []
+    }
+
+    with MirrorSimulator(enable_https=False) as simulator:
+        for sites, mirrors in parse_scales(args.scales):
+            entry = run_scale(simulator, sites, mirrors, args, rng)
+            report['scales'].append(entry)
+            stages = ' '.join(f"{name}={metrics['seconds']:.2f}s" for name, metrics in entry['stages'].items())
+            print(f"{sites}x{mirrors} ({entry['urls']} URL): {stages}", file=sys.stderr)
+
+    report['scaling'] = scaling_summary(report['scales'])
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output)
+        print(f"结果已保存到: {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
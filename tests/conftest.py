@@ -0,0 +1,22 @@
+"""测试公共夹具：在临时目录中生成与项目根目录结构一致的工作目录"""
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR / "src"))
+sys.path.insert(0, str(ROOT_DIR / "benchmarks"))
+
+from mirror_simulator import write_workspace  # noqa: E402
+from pan_site_monitor import PanSiteMonitor  # noqa: E402
+
+
+@pytest.fixture
+def make_monitor(tmp_path):
+    """按站点URL映射生成工作目录并创建监控实例"""
+    def factory(site_urls=None, url_tester=None, history=None):
+        site_urls = site_urls or {"A": ["http://a1"], "B": ["http://b1"]}
+        config_file = write_workspace(str(tmp_path), site_urls, url_tester=url_tester, history=history)
+        return PanSiteMonitor(config_file, base_dir=str(tmp_path), use_config_cache=False)
+    return factory
@@ -0,0 +1,144 @@
+"""长期统计测试：汇总层、保留期与统计报告"""
+import math
+import random
+
+import pytest
+
+from pan_site_monitor import AnalyticsStore
+
+UP, DOWN, NOT_MEASURED = AnalyticsStore.STATUS_UP, AnalyticsStore.STATUS_DOWN, AnalyticsStore.STATUS_NOT_MEASURED
+BASE = AnalyticsStore.bucket_start(1_700_000_000, 86400)
+
+
+def _percentile(values, fraction):
+    values = sorted(values)
+    rank = (len(values) - 1) * fraction
+    low = math.floor(rank)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (rank - low)
+
+
+def _tier_rows(store, name):
+    data = store.read_tier(name)
+    return [dict(zip(data, row)) for row in zip(*data.values())]
+
+
+def test_hourly_rollup_matches_raw(tmp_path):
+    store = AnalyticsStore(tmp_path)
+    rng = random.Random(7)
+    expected = {}
+    for step in range(3 * 6):
+        timestamp = BASE + step * 600
+        rows = []
+        for url in ("http://a1", "http://a2"):
+            status = rng.choice([UP, UP, UP, DOWN, NOT_MEASURED])
+            latency = round(rng.uniform(0.1, 2.0), 3) if status == UP else None
+            rows.append(("A", url, latency, status, None if status == UP else "timeout"))
+            bucket = expected.setdefault((AnalyticsStore.bucket_start(timestamp, 3600), url), [0, []])
+            bucket[0] += status != NOT_MEASURED
+            if status == UP:
+                bucket[1].append(latency)
+        store.append(timestamp, rows)
+    # 进入第4个小时后，前3个小时全部汇总
+    store.append(BASE + 3 * 3600, [("A", "http://a1", 0.5, UP, None)])
+    assert store.rolled_up == ["hourly"]
+
+    rows = _tier_rows(store, "hourly")
+    assert len(rows) == len(expected) == 6
+    for row in rows:
+        count, latencies = expected[(row["timestamp"], store.urls[row["url_id"]][1])]
+        assert row["count"] == count
+        assert row["up"] == len(latencies)
+        if latencies:
+            assert row["min"] == pytest.approx(min(latencies), rel=1e-6)
+            assert row["max"] == pytest.approx(max(latencies), rel=1e-6)
+            assert row["mean"] == pytest.approx(sum(latencies) / len(latencies), rel=1e-6)
+            assert row["p95"] == pytest.approx(_percentile(latencies, 0.95), rel=1e-6)
+        else:
+            assert math.isnan(row["mean"])
+
+
+def test_rollup_is_incremental_across_instances(tmp_path):
+    store = AnalyticsStore(tmp_path)
+    for hour in range(3):
+        store.append(BASE + hour * 3600, [("A", "http://a1", 0.2, UP, None)])
+    assert len(_tier_rows(store, "hourly")) == 2
+
+    reopened = AnalyticsStore(tmp_path)
+    reopened.append(BASE + 2 * 3600 + 60, [("A", "http://a1", 0.3, UP, None)])
+    assert reopened.rolled_up == []
+    reopened.append(BASE + 3 * 3600, [("A", "http://a1", 0.4, UP, None)])
+    rows = _tier_rows(reopened, "hourly")
+    assert [row["timestamp"] for row in rows] == [BASE + hour * 3600 for hour in range(3)]
+    assert rows[-1]["count"] == 2
+
+
+def test_retention_bounds_each_tier(tmp_path):
+    store = AnalyticsStore(tmp_path, {"raw_days": 1, "hourly_days": 2, "daily_days": 0})
+    days = 6
+    for hour in range(days * 24 + 1):
+        store.append(BASE + hour * 3600, [("A", "http://a1", 0.2, UP, None), ("A", "http://a2", None, DOWN, "x")])
+    now = BASE + days * 86400
+
+    # 清理约每天执行一次，最早的行最多比保留期早一天
+    assert store.raw.timestamp_at(0) >= now - 2 * 86400
+    assert store.tiers["hourly"].timestamp_at(0) >= now - 3 * 86400
+    daily = _tier_rows(store, "daily")
+    assert [row["timestamp"] for row in daily if row["url_id"] == 0] == [BASE + day * 86400 for day in range(days)]
+    assert all(row["count"] == 24 for row in daily)
+
+
+def test_report_matches_python_reference(make_monitor):
+    monitor = make_monitor()
+    monitor.config['analytics'] = {'store_dir': str(monitor.base_dir / 'analytics'), 'best_min_uptime': 0.5}
+    store = monitor._analytics_store()
+    rng = random.Random(11)
+    expected = {}
+    for step in range(40):
+        rows = []
+        for site, url in (("A", "http://a1"), ("A", "http://a2"), ("B", "http://b1")):
+            status = rng.choice([UP, UP, DOWN, NOT_MEASURED])
+            latency = round(rng.uniform(0.1, 3.0), 3) if status == UP else None
+            error = None if status == UP else rng.choice(["timeout", "http_error"])
+            rows.append((site, url, latency, status, error))
+            stats = expected.setdefault(url, {"samples": 0, "measured": 0, "latencies": [], "errors": {}})
+            stats["samples"] += 1
+            stats["measured"] += status != NOT_MEASURED
+            if status == UP:
+                stats["latencies"].append(latency)
+            elif status == DOWN:
+                stats["errors"][error] = stats["errors"].get(error, 0) + 1
+        store.append(BASE + step * 600, rows)
+
+    report = monitor.build_report()
+
+    assert report["records"] == 120
+    for site, site_report in report["sites"].items():
+        for url, url_report in site_report["urls"].items():
+            stats = expected[url]
+            assert url_report["samples"] == stats["samples"]
+            assert url_report["measured"] == stats["measured"]
+            assert url_report["uptime"] == pytest.approx(len(stats["latencies"]) / stats["measured"], abs=1e-4)
+            assert url_report["errors"] == stats["errors"]
+            for name, fraction in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99)):
+                assert url_report["latency"][name] == pytest.approx(_percentile(stats["latencies"], fraction), abs=1e-3)
+    candidates = [(report["sites"]["A"]["urls"][url]["latency"]["p95"], url) for url in ("http://a1", "http://a2")
+                  if report["sites"]["A"]["urls"][url]["uptime"] >= 0.5]
+    assert report["sites"]["A"]["best_url"] == (min(candidates)[1] if candidates else None)
+    assert set(monitor.build_report(site_name="B")["sites"]) == {"B"}
+
+
+def test_trends_export_recent_points(make_monitor):
+    monitor = make_monitor()
+    monitor.config['analytics'] = {'trends': {'hourly_points': 2, 'daily_points': 0}}
+    store = AnalyticsStore(monitor.base_dir / 'analytics')
+    for hour in range(5):
+        store.append(BASE + hour * 3600, [("A", "http://a1", 0.5 + hour, UP, None)])
+    store.append(BASE + 5 * 3600, [("A", "http://a1", None, DOWN, "timeout")])
+
+    trends = monitor.build_trends(store, now=BASE + 5 * 3600)
+
+    assert set(trends["tiers"]) == {"hourly"}
+    series = trends["sites"]["A"]["http://a1"]["hourly"]
+    assert [point[1:4] for point in series] == [[1, 1, 3.5], [1, 1, 4.5]]
+    assert len(trends["columns"]) == len(series[0])
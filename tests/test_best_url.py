@@ -0,0 +1,61 @@
+"""最佳URL选择与上次快照状态读取测试"""
+from pan_site_monitor import DEFAULT_RANK_BY, PanSiteMonitor, ProbeResult
+
+
+def _results(site_urls, latency=0.2):
+    return {
+        site_name: {'best_url': urls[0],
+                    'url_results': {url: ProbeResult(url, site_name, latency, True) for url in urls}}
+        for site_name, urls in site_urls.items()
+    }
+
+
+def test_rank_by_default_matches_config_default(make_monitor):
+    monitor = make_monitor()
+    monitor._previous_best_urls = {}
+    health = {'http://fast': {'score': 5.0}, 'http://steady': {'score': 1.0}}
+    valid = {'http://fast': 0.1, 'http://steady': 0.2}
+
+    assert monitor.config['url_tester']['health']['rank_by'] == DEFAULT_RANK_BY
+    monitor.config['url_tester'].pop('health')
+    assert monitor._select_best_url('A', valid, health) == 'http://steady'
+
+
+def test_snapshot_parsed_once_per_run(make_monitor):
+    site_urls = {"A": ["http://a1"], "B": ["http://b1"]}
+    monitor = make_monitor(site_urls)
+    monitor.save_monitor_results(_results(site_urls), source_index=site_urls)
+
+    monitor = PanSiteMonitor(str(monitor.base_dir / "config" / "app_config.json"),
+                             base_dir=str(monitor.base_dir), use_config_cache=False)
+    loads = []
+    load_file = monitor.serializer.load_file
+    monitor.serializer.load_file = lambda path: loads.append(path) or load_file(path)
+
+    assert monitor._get_previous_best_urls() == {"A": "http://a1", "B": "http://b1"}
+    monitor.save_monitor_results(_results(site_urls), source_index=site_urls)
+    assert len(loads) == 1
+
+    history = monitor._read_history()
+    assert len(history["A"]["http://a1"]) == 2
+
+
+def test_health_entry_ewma(make_monitor):
+    monitor = make_monitor()
+    monitor.config['url_tester']['health'].update({'alpha': 0.5, 'availability_floor': 0.05})
+
+    entry = monitor._update_health_entry(None, 0.2)
+    assert (entry['ewma_latency'], entry['availability'], entry['score']) == (0.2, 1.0, 0.2)
+    entry = monitor._update_health_entry(entry, None)
+    assert (entry['ewma_latency'], entry['availability'], entry['samples']) == (0.2, 0.5, 2)
+    assert entry['score'] == 0.4
+    entry = monitor._update_health_entry(entry, 0.4)
+    assert entry['ewma_latency'] == 0.3
+    assert entry['availability'] == 0.75
+
+
+def test_not_measured_keeps_health(make_monitor):
+    monitor = make_monitor()
+    monitor._health_state = {'A': {'http://a1': {'availability': 1.0, 'ewma_latency': 0.2, 'score': 0.2}}}
+    health = monitor._apply_health('A', {'http://a1': ProbeResult.not_measured('http://a1', 'A')})
+    assert health['http://a1']['availability'] == 1.0
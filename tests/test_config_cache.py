@@ -0,0 +1,35 @@
+"""配置缓存测试"""
+import json
+
+from pan_site_monitor import PanSiteMonitor
+
+
+def _open(workspace):
+    return PanSiteMonitor(str(workspace / "config" / "app_config.json"), base_dir=str(workspace))
+
+
+def test_cache_hit_and_invalidation(make_monitor, monkeypatch):
+    monkeypatch.setenv('GITHUB_TOKEN', 'env-token-1234567890')
+    workspace = make_monitor().base_dir
+
+    first = _open(workspace)
+    assert first.config_cache_status == "miss"
+    second = _open(workspace)
+    assert second.config_cache_status == "hit"
+    assert second.config == first.config
+    assert second.config['github']['token'] == 'env-token-1234567890'
+
+    # 来自环境变量的token不写入缓存文件
+    with open(workspace / "data" / ".config_cache.json", 'r', encoding='utf-8') as f:
+        assert json.load(f)['config']['github']['token'] == ""
+
+    config_file = workspace / "config" / "app_config.json"
+    config = json.loads(config_file.read_text(encoding='utf-8'))
+    config['url_tester']['test_timeout'] = 7
+    config_file.write_text(json.dumps(config, ensure_ascii=False, indent=4), encoding='utf-8')
+    third = _open(workspace)
+    assert third.config_cache_status == "miss"
+    assert third.config['url_tester']['test_timeout'] == 7
+
+    monkeypatch.setenv('LOG_LEVEL', 'DEBUG')
+    assert _open(workspace).config_cache_status == "miss"
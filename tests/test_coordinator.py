@@ -0,0 +1,76 @@
+"""协调节点 HTTP 接口测试"""
+import socket
+import threading
+import time
+
+import requests
+
+from pan_site_monitor import ProbeResult
+
+
+def _free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _post(url, **kwargs):
+    for _ in range(50):
+        try:
+            return requests.post(url, timeout=5, **kwargs)
+        except requests.ConnectionError:
+            time.sleep(0.1)
+    raise AssertionError("协调节点未启动")
+
+
+def test_results_must_be_json_object(make_monitor):
+    monitor = make_monitor()
+    port = _free_port()
+    collected = []
+    thread = threading.Thread(target=lambda: collected.extend(
+        monitor._collect_documents_over_http(f"127.0.0.1:{port}", expect=1, split=1, wait_timeout=10)))
+    thread.start()
+
+    url = f"http://127.0.0.1:{port}/results"
+    assert _post(url, data=b'not json').status_code == 400
+    assert _post(url, json=["a", "b"]).status_code == 400
+    assert _post(url, json="text").status_code == 400
+    assert _post(url, json={"worker": "w1", "vantage": "cn"}).status_code == 200
+
+    thread.join(10)
+    assert collected == [{"worker": "w1", "vantage": "cn"}]
+
+
+def _document(monitor, vantage, latencies, timestamp):
+    results = {"A": {'best_url': None, 'url_results': {
+        url: ProbeResult(url, "A", latency, latency is not None,
+                         None if latency is not None else {"type": "timeout", "detail": "超时"})
+        for url, latency in latencies.items()
+    }}}
+    document = monitor.export_probe_results(results, vantage)
+    document["timestamp"] = timestamp
+    return document
+
+
+def test_merge_aggregates_vantages(make_monitor):
+    monitor = make_monitor({"A": ["http://a1", "http://a2"]})
+    monitor._previous_best_urls = {}
+    monitor.config['url_tester']['health']['rank_by'] = 'latency'
+    documents = [
+        _document(monitor, "cn", {"http://a1": 0.1, "http://a2": 0.4}, "2024-01-01T00:00:00"),
+        _document(monitor, "us", {"http://a1": None, "http://a2": 0.5}, "2024-01-01T00:00:00"),
+        _document(monitor, "hk", {"http://a1": 0.2, "http://a2": 0.3}, "2024-01-01T00:00:00"),
+        # 同一观测点较新的结果覆盖较早的结果
+        _document(monitor, "hk", {"http://a1": 0.2, "http://a2": 0.6}, "2024-01-01T01:00:00"),
+    ]
+
+    results = monitor.merge_probe_results(documents, policy='median')
+
+    a1, a2 = results["A"]["url_results"]["http://a1"], results["A"]["url_results"]["http://a2"]
+    assert a1.latency == 0.2  # median(0.1, inf, 0.2)
+    assert a2.latency == 0.5  # median(0.4, 0.5, 0.6)
+    assert results["A"]["best_url"] == "http://a1"
+    assert results["A"]["vantages"]["http://a1"] == {"cn": 0.1, "us": None, "hk": 0.2}
+
+    assert monitor.merge_probe_results(documents, policy='max')["A"]["best_url"] == "http://a2"
+    assert monitor.merge_probe_results([{"format": "other"}]) == {}
@@ -0,0 +1,46 @@
+"""运行期限测试"""
+import time
+
+from mirror_simulator import MirrorSimulator
+from pan_site_monitor import ProbeOptions, ProbeResult, Prober, ProbeTarget
+
+
+def test_expired_deadline_yields_not_measured():
+    with MirrorSimulator(enable_https=False) as simulator:
+        url = simulator.mirror_url('fast', 'd-0')
+        prober = Prober(ProbeOptions(rate=0, min_timeout=2))
+        prober.deadline = time.monotonic() + 1
+
+        result = prober.probe(ProbeTarget(url))
+
+        assert result.error['type'] == 'not_measured'
+        assert not result.measured and not result.ok
+        assert simulator.request_counts() == {}
+
+
+def test_probe_priority_tiers(make_monitor):
+    monitor = make_monitor(site_urls={"A": ["http://best", "http://good", "http://new", "http://dead"]})
+    monitor._previous_best_urls = {"A": "http://best"}
+    monitor._health_state = {"A": {
+        "http://best": {"availability": 0.2},
+        "http://good": {"availability": 0.9, "ewma_latency": 0.3},
+        "http://dead": {"availability": 0.0},
+    }}
+
+    ordered = sorted(["http://dead", "http://new", "http://good", "http://best"],
+                     key=lambda url: monitor._probe_priority("A", url))
+
+    assert ordered == ["http://best", "http://good", "http://new", "http://dead"]
+
+
+def test_unmeasured_site_not_counted_as_failed(make_monitor):
+    monitor = make_monitor()
+    results = {
+        "A": {"best_url": None, "url_results": {"http://a1": ProbeResult.not_measured("http://a1", "A")}},
+        "B": {"best_url": None, "url_results": {"http://b1": ProbeResult("http://b1", "B", error={"type": "timeout"})}},
+    }
+
+    snapshot = monitor.build_snapshot(results)
+
+    assert snapshot["sites"]["A"]["status"] == "not_measured"
+    assert snapshot["sites"]["B"]["status"] == "failed"
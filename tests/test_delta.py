@@ -0,0 +1,117 @@
+"""增量文档测试：后端 build_delta 与前端 applyDelta 的结果应与完整快照一致"""
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from conftest import ROOT_DIR
+from pan_site_monitor import ProbeResult
+
+SITE_URLS = {"A": ["http://a1", "http://a2"], "B": ["http://b1"]}
+
+APPLY_DELTA_SCRIPT = """
+import { readFileSync } from 'node:fs';
+import { loader } from '%s';
+const [data, delta] = process.argv.slice(-2).map(path => JSON.parse(readFileSync(path, 'utf-8')));
+process.stdout.write(JSON.stringify(loader.applyDelta(data, delta)));
+"""
+
+
+def _results(latencies):
+    results = {}
+    for site_name, urls in SITE_URLS.items():
+        url_results = {}
+        for url in urls:
+            latency = latencies.get(url)
+            error = None if latency is not None else {"type": "http_error", "detail": "HTTP 503"}
+            url_results[url] = ProbeResult(url, site_name, latency, latency is not None, error)
+        valid = {url: result.latency for url, result in url_results.items() if result.ok}
+        results[site_name] = {'best_url': min(valid, key=valid.get) if valid else None,
+                              'url_results': url_results}
+    return results
+
+
+def _read(monitor, name):
+    with open(monitor.base_dir / "web" / "assets" / "data" / name, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _apply_delta_js(tmp_path, data, delta):
+    data_file, delta_file, script = tmp_path / "data.json", tmp_path / "delta.json", tmp_path / "apply.mjs"
+    data_file.write_text(json.dumps(data), encoding='utf-8')
+    delta_file.write_text(json.dumps(delta), encoding='utf-8')
+    loader = (ROOT_DIR / "web" / "assets" / "js" / "data" / "loader.js").as_uri()
+    script.write_text(APPLY_DELTA_SCRIPT % loader, encoding='utf-8')
+    output = subprocess.run(["node", str(script), str(data_file), str(delta_file)],
+                            check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def _site_view(data):
+    return {
+        site_name: (site['best_url'], site['status'],
+                    sorted((url['url'], url['latency'], url['is_best']) for url in site['urls']))
+        for site_name, site in data['sites'].items()
+    }
+
+
+@pytest.fixture
+def partial_save(make_monitor):
+    """完整保存一次后只更新站点A，返回 (监控实例, 第一次快照, 第二次快照, 第二次增量)"""
+    monitor = make_monitor(SITE_URLS)
+    monitor.save_monitor_results(_results({"http://a1": 0.3, "http://a2": 0.5, "http://b1": 0.2}),
+                                 source_index=SITE_URLS)
+    first = _read(monitor, "monitor_data.json")
+    monitor.save_monitor_results(_results({"http://a2": 0.4, "http://b1": 0.2}),
+                                 source_index=SITE_URLS, updated_sites=["A"])
+    return monitor, first, _read(monitor, "monitor_data.json"), _read(monitor, "monitor_delta.json")
+
+
+def test_full_save_delta(make_monitor):
+    monitor = make_monitor(SITE_URLS)
+    monitor.save_monitor_results(_results({"http://a1": 0.3, "http://b1": 0.2}), source_index=SITE_URLS)
+    delta = _read(monitor, "monitor_delta.json")
+    assert delta["seq"] == 1
+    assert delta["sites"]["A"]["up"] == {"http://a1": 0.3}
+    assert delta["sites"]["A"]["down"] == {"http://a2": "HTTP 503"}
+    assert delta["sites"]["B"]["up"] == {"http://b1": 0.2}
+
+
+def test_partial_save_only_carries_updated_points(partial_save):
+    _, _, second, delta = partial_save
+    assert len(second["history"]["A"]["http://a1"]) == 2
+    assert len(second["history"]["B"]["http://b1"]) == 1
+    assert delta["seq"] == 2
+    assert delta["sites"]["A"]["best_url"] == "http://a2"
+    assert delta["sites"]["A"]["up"] == {"http://a2": 0.4}
+    assert delta["sites"]["A"]["down"] == {"http://a1": "HTTP 503"}
+    assert delta["sites"]["B"] == {"best_url": "http://b1", "status": second["sites"]["B"]["status"]}
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="需要 Node.js 运行前端模块")
+def test_apply_delta_matches_snapshot(partial_save, tmp_path):
+    _, first, second, delta = partial_save
+    applied = _apply_delta_js(tmp_path, first, delta)
+    assert applied["seq"] == second["seq"]
+    assert applied["history"] == second["history"]
+    assert _site_view(applied) == _site_view(second)
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="需要 Node.js 运行前端模块")
+def test_removed_urls_match_snapshot(make_monitor, tmp_path):
+    monitor = make_monitor(SITE_URLS)
+    monitor.config['url_tester']['retention'] = {'prune_retired': True, 'grace_hours': 0}
+    monitor.save_monitor_results(_results({"http://a1": 0.3, "http://b1": 0.2}), source_index=SITE_URLS)
+    first = _read(monitor, "monitor_data.json")
+
+    remaining = {"A": ["http://a1"]}
+    results = _results({"http://a1": 0.3})
+    monitor.save_monitor_results({"A": {'best_url': "http://a1", 'url_results': {
+        "http://a1": results["A"]["url_results"]["http://a1"]}}}, source_index=remaining)
+    second, delta = _read(monitor, "monitor_data.json"), _read(monitor, "monitor_delta.json")
+
+    assert delta["removed"] == {"A": ["http://a2"], "B": ["http://b1"]}
+    applied = _apply_delta_js(tmp_path, first, delta)
+    assert applied["history"] == second["history"]
+    assert _site_view(applied) == _site_view(second)
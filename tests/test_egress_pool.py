@@ -0,0 +1,31 @@
+"""出口池测试"""
+from pan_site_monitor import EgressPool
+
+
+def test_acquire_prefers_least_in_flight():
+    pool = EgressPool([('direct', None), ('p1', {'http': 'http://p1'})])
+    first = pool.acquire()
+    second = pool.acquire()
+    assert {first.name, second.name} == {'direct', 'p1'}
+
+    pool.release(first)
+    assert pool.acquire() is first
+    # 重试排除已用出口
+    assert pool.acquire(exclude=(first,)) is second
+
+
+def test_failed_egress_ejected_and_blamed_only_on_switch():
+    pool = EgressPool([('direct', None), ('p1', {'http': 'http://p1'})], eject_failures=2)
+    direct, proxy = pool.egresses
+
+    # 全部失败且无代理错误：归咎镜像，不计入出口
+    pool.record([[direct, False], [proxy, False]], None)
+    assert direct.failures == proxy.failures == 0
+
+    # 换出口后成功：之前的出口计失败
+    pool.record([[proxy, False], [direct, False]], 0.2)
+    pool.record([[proxy, True]], None)
+    assert proxy.failures == 2 and direct.successes == 1
+    assert proxy.ejected_until > 0
+    assert all(pool.acquire() is direct for _ in range(3))
+    assert pool.stats()['p1']['ejections'] == 1
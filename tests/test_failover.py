@@ -0,0 +1,30 @@
+"""常驻模式故障快速检测测试"""
+import pytest
+
+from mirror_simulator import MirrorSimulator
+
+
+@pytest.fixture(scope="module")
+def simulator():
+    with MirrorSimulator(enable_https=False) as sim:
+        yield sim
+
+
+def test_recheck_probes_once_without_retries(simulator, make_monitor):
+    best_urls = {
+        "ok": simulator.mirror_url('fast', 'recheck-ok'),
+        "flaky": simulator.mirror_url('forbidden_then_ok', 'recheck-flaky'),
+        "gone": simulator.mirror_url('refused', 'recheck-gone'),
+    }
+    monitor = make_monitor({site_name: [url] for site_name, url in best_urls.items()},
+                           url_tester={'rate_limit': {'rate': 0}, 'test_timeout': 2})
+    before = simulator.request_counts()
+
+    failed = monitor.recheck_best_urls(best_urls)
+
+    after = simulator.request_counts()
+    assert sorted(failed) == ["flaky", "gone"]
+    # 403 不重试：每个镜像只收到一次请求
+    assert after.get('forbidden_then_ok', 0) - before.get('forbidden_then_ok', 0) == 1
+    assert after.get('fast', 0) - before.get('fast', 0) == 1
+    assert monitor.prober.options.max_retries > 0
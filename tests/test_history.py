@@ -0,0 +1,44 @@
+"""历史记录环形缓冲与下线URL清理测试"""
+from datetime import datetime, timedelta
+
+from pan_site_monitor import ProbeResult
+
+
+def _results(site_urls):
+    return {site_name: {'best_url': urls[0], 'url_results': {
+        url: ProbeResult(url, site_name, 0.2, True) for url in urls}}
+        for site_name, urls in site_urls.items()}
+
+
+def _record(hours_ago):
+    return {"timestamp": (datetime.now() - timedelta(hours=hours_ago)).isoformat(),
+            "status": "up", "latency": 0.2, "is_best": False}
+
+
+def test_history_limit(make_monitor):
+    site_urls = {"A": ["http://a1"]}
+    monitor = make_monitor(site_urls, url_tester={'history_limit': 3},
+                           history={"A": {"http://a1": [_record(hours) for hours in range(5, 0, -1)]}})
+    history = monitor.update_history(_results(site_urls), site_urls)
+    records = history["A"]["http://a1"]
+    assert len(records) == 3
+    assert isinstance(records, list)
+    assert records[-1]["timestamp"] == monitor._history_timestamp
+
+
+def test_prune_retired_after_grace(make_monitor):
+    site_urls = {"A": ["http://a1"]}
+    history = {
+        "A": {"http://a1": [_record(1)], "http://recent": [_record(10)], "http://old": [_record(100)]},
+        "Gone": {"http://g1": [_record(200)]},
+    }
+    monitor = make_monitor(site_urls, history=history)
+    monitor._load_previous_state()
+    monitor._health_state = {"A": {"http://old": {}, "http://a1": {}}, "Gone": {"http://g1": {}}}
+
+    result = monitor.update_history(_results(site_urls), site_urls)
+
+    assert set(result) == {"A"}
+    assert set(result["A"]) == {"http://a1", "http://recent"}
+    assert monitor._pruned_urls == {"A": ["http://old"], "Gone": ["http://g1"]}
+    assert monitor._health_state == {"A": {"http://a1": {}}}
@@ -0,0 +1,91 @@
+"""关键字匹配器测试"""
+import time
+
+import pytest
+
+from pan_site_monitor import KeywordMatcher
+
+
+def test_single_literal():
+    matcher = KeywordMatcher.from_config('class="search-stat"')
+    assert matcher.match(b'<div class="search-stat">') == (True, None, None)
+    assert matcher.match(b'<div>none</div>') == (False, 'class="search-stat"', 'missing')
+
+
+def test_forbidden_nested_in_required():
+    matcher = KeywordMatcher(required=['search-stat'], forbidden=['stat'])
+    assert matcher.match(b'<div class="search-stat">') == (False, 'stat', 'forbidden')
+
+
+def test_required_nested_in_required():
+    matcher = KeywordMatcher(required=['abcdef', 'cd'])
+    assert matcher.match(b'xxabcdefxx') == (True, None, None)
+
+
+def test_overlapping_markers():
+    matcher = KeywordMatcher(required=['abc', 'bcd'])
+    assert matcher.match(b'xabcdx') == (True, None, None)
+    assert matcher.match(b'xabcx') == (False, 'bcd', 'missing')
+
+
+def test_forbidden_overlapping_required():
+    matcher = KeywordMatcher(required=['search'], forbidden=['chst'])
+    assert matcher.match(b'searchstat') == (False, 'chst', 'forbidden')
+    assert matcher.match(b'search stat') == (True, None, None)
+
+
+def test_markers_inside_regex_hit():
+    matcher = KeywordMatcher(required=[{'regex': r'<div[^>]*>', 'name': 'div'}], forbidden=['class="x"'])
+    assert matcher.match(b'<div class="x">') == (False, 'class="x"', 'forbidden')
+    assert matcher.match(b'<div class="y">') == (True, None, None)
+
+
+def test_same_marker_required_and_forbidden():
+    matcher = KeywordMatcher(required=['stat', 'abc'], forbidden=['stat'])
+    assert matcher.match(b'abc stat') == (False, 'stat', 'forbidden')
+
+
+def test_overlap_checked_while_scanning_for_forbidden():
+    matcher = KeywordMatcher(required=['abc', 'bcd'], forbidden=['zzz'])
+    assert matcher.match(b'xabcdx' * 3) == (True, None, None)
+    assert matcher.match(b'xabcx' * 3) == (False, 'bcd', 'missing')
+
+
+def test_cost_flat_in_marker_count():
+    body = b''.join(b'<div class="search-stat">item %d</div>\n' % index for index in range(5000))
+
+    def elapsed(count):
+        matcher = KeywordMatcher(required=['class="search-stat"'],
+                                 forbidden=[f'blocked-{index}-marker' for index in range(count)])
+        best = float('inf')
+        for _ in range(3):
+            started = time.perf_counter()
+            assert matcher.match(body) == (True, None, None)
+            best = min(best, time.perf_counter() - started)
+        return best
+
+    # 单次扫描：禁止标记从1个增加到200个，耗时不随标记数成倍增长
+    assert elapsed(200) < elapsed(1) * 5 + 0.02
+
+
+def test_regex_and_ignore_case():
+    matcher = KeywordMatcher.from_config({
+        'required': [{'regex': r'vod-\d+', 'name': 'vod'}, {'literal': 'OK', 'name': 'ok'}],
+        'forbidden': [{'regex': '(?i)captcha'}],
+    })
+    assert matcher.match(b'vod-12 OK') == (True, None, None)
+    assert matcher.match(b'vod-12 OK CAPTCHA') == (False, 'regex:(?i)captcha', 'forbidden')
+    assert matcher.match(b'vod-x OK') == (False, 'vod', 'missing')
+
+
+def test_utf8_markers():
+    matcher = KeywordMatcher(required=['搜索结果'], forbidden=['暂无'])
+    assert matcher.match('<div>搜索结果</div>'.encode('utf-8')) == (True, None, None)
+    assert matcher.match('<div>暂无搜索结果</div>'.encode('utf-8'))[2] == 'forbidden'
+
+
+def test_invalid_spec():
+    with pytest.raises(ValueError):
+        KeywordMatcher.from_config(42)
+    with pytest.raises(ValueError):
+        KeywordMatcher(required=[{'unknown': 'x'}])
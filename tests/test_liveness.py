@@ -0,0 +1,25 @@
+"""存活检查测试"""
+from mirror_simulator import MirrorSimulator
+from pan_site_monitor import ProbeOptions, Prober
+
+
+def test_liveness_checks_each_host_once():
+    with MirrorSimulator(enable_https=False) as simulator:
+        live = [simulator.mirror_url('fast', 'l-0'), simulator.mirror_url('no_keyword', 'l-1')]
+        dead = simulator.mirror_url('refused', 'l-2')
+        prober = Prober(ProbeOptions(liveness_timeout=1))
+
+        outcome = prober.check_liveness(live + [dead, 'not a url', ''])
+
+        assert outcome[live[0]] is None and outcome[live[1]] is None
+        assert outcome[dead]['type'] == 'connection_error'
+        assert outcome[dead]['stage'] == 'liveness'
+        assert outcome['not a url'] is None
+        # 存活检查只建立连接，不发出HTTP请求
+        assert simulator.request_counts() == {}
+
+
+def test_liveness_skipped():
+    assert Prober(ProbeOptions(liveness_check=False)).check_liveness(['http://127.0.0.1:1']) == {}
+    proxied = Prober(ProbeOptions(proxies={'http': 'http://127.0.0.1:1'}))
+    assert proxied.check_liveness(['http://127.0.0.1:1']) == {}
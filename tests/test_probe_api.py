@@ -0,0 +1,21 @@
+"""嵌入式探测入口测试"""
+from mirror_simulator import KEYWORD, MirrorSimulator
+from pan_site_monitor import ProbeOptions, ProbeTarget, probe_urls
+
+
+def test_probe_urls_streams_results():
+    with MirrorSimulator(enable_https=False) as simulator:
+        fast = simulator.mirror_url('fast', 'p-0')
+        missing = simulator.mirror_url('no_keyword', 'p-1')
+        dead = simulator.mirror_url('refused', 'p-2')
+        targets = [ProbeTarget(fast, 'A', keyword=KEYWORD), ProbeTarget(missing, 'A', keyword=KEYWORD), dead]
+
+        results = {result.url: result for result in
+                   probe_urls(targets, ProbeOptions(max_retries=0, timeout=2, liveness_timeout=1))}
+
+        assert set(results) == {fast, missing, dead}
+        assert results[fast].ok and results[fast].site == 'A'
+        assert not results[missing].ok and results[missing].has_keyword is False
+        # 存活检查未通过的目标不发出HTTP请求，直接产出失败结果
+        assert results[dead].error['stage'] == 'liveness'
+        assert simulator.request_counts() == {'fast': 1, 'no_keyword': 1}
@@ -0,0 +1,50 @@
+"""站点探测两阶段（探测、汇总）与流水线测试"""
+import json
+
+import pytest
+from mirror_simulator import MirrorSimulator
+
+
+def test_probe_then_finalize(make_monitor):
+    with MirrorSimulator(enable_https=False) as simulator:
+        urls = [simulator.mirror_url('refused', 'p-0'), simulator.mirror_url('no_keyword', 'p-1'),
+                simulator.mirror_url('fast', 'p-2')]
+        monitor = make_monitor({"A": urls}, url_tester={'rate_limit': {'rate': 0}, 'test_timeout': 2})
+
+        site_urls, liveness, probed = monitor.probe_extracted_urls({"A": urls})
+        assert site_urls == {"A": urls}
+        assert liveness[urls[0]] is not None
+        assert set(probed["A"]) == set(urls[1:])
+
+        results = monitor.finalize_sites(site_urls, liveness, probed)
+        assert results["A"]["best_url"] == urls[2]
+        assert [url for url, result in results["A"]["url_results"].items() if result.ok] == [urls[2]]
+
+
+def test_pipeline_probes_only_new_urls(make_monitor):
+    with MirrorSimulator(enable_https=False) as simulator:
+        old, kept, new = (simulator.mirror_url('fast', f'q-{index}') for index in range(3))
+        monitor = make_monitor({"A": [old, kept]}, url_tester={'rate_limit': {'rate': 0}, 'test_timeout': 2})
+
+        def fake_tvbox(check_update=True, aggregate_data=True):
+            (monitor.base_dir / 'data' / 'test.json').write_text(json.dumps({"A": [kept, new]}), encoding='utf-8')
+            return {'update': True, 'aggregate': True}
+
+        monitor.run_tvbox_manager = fake_tvbox
+        assert monitor.run_pipeline(upload=False) is True
+
+        # 已测URL沿用首轮结果，只补测新增URL；下线的URL不再出现
+        assert simulator.request_counts() == {'fast': 3}
+        snapshot = json.loads((monitor.base_dir / 'web' / 'assets' / 'data' / 'monitor_data.json').read_text('utf-8'))
+        assert {entry['url'] for entry in snapshot['sites']['A']['urls']} == {kept, new}
+
+
+def test_pipeline_fails_without_upload_when_tvbox_fails(make_monitor):
+    with MirrorSimulator(enable_https=False) as simulator:
+        url = simulator.mirror_url('fast', 'r-0')
+        monitor = make_monitor({"A": [url]}, url_tester={'rate_limit': {'rate': 0}, 'test_timeout': 2})
+        monitor.run_tvbox_manager = lambda **kwargs: {'update': False, 'aggregate': False}
+        monitor.run_github_uploader = lambda: pytest.fail("TVBox失败时不应上传")
+
+        assert monitor.run_pipeline() is False
+        assert (monitor.base_dir / 'web' / 'assets' / 'data' / 'monitor_data.json').exists()
@@ -0,0 +1,33 @@
+"""令牌桶与限速器测试"""
+import pytest
+
+from pan_site_monitor import RateLimiter, TokenBucket
+
+
+def test_token_bucket_burst_then_rate():
+    bucket = TokenBucket(rate=2, burst=2, now=100.0)
+    assert bucket.reserve(100.0) == 0
+    assert bucket.reserve(100.0) == 0
+    # 容量用尽后按预约顺序排队：第3、4个请求分别等待0.5、1秒
+    assert bucket.reserve(100.0) == pytest.approx(0.5)
+    assert bucket.reserve(100.0) == pytest.approx(1.0)
+    # 补充的令牌不超过容量
+    bucket.reserve(200.0)
+    assert bucket.tokens == pytest.approx(1.0)
+
+
+def test_token_bucket_blocked_and_unlimited():
+    bucket = TokenBucket(rate=0, burst=1, now=0.0)
+    assert all(bucket.reserve(0.0) == 0 for _ in range(5))
+    bucket.blocked_until = 3.0
+    assert bucket.reserve(1.0) == pytest.approx(2.0)
+
+
+def test_rate_limiter_defer_per_host():
+    limiter = RateLimiter(rate=0, per_ip=False)
+    assert limiter.acquire('http://a.example/x') == 0
+    assert limiter.acquire('not a url') == 0
+
+    limiter.defer('http://a.example/x', 0.2)
+    assert limiter.acquire('http://b.example/') == 0
+    assert 0.1 < limiter.acquire('http://a.example/y') <= 0.2
@@ -0,0 +1,44 @@
+"""重定向缓存测试"""
+import time
+
+from pan_site_monitor import RedirectCache
+
+
+HOPS = [
+    {"from": "http://old/s", "to": "http://mid/s", "status": 301},
+    {"from": "http://mid/s", "to": "http://new/s", "status": 308},
+    {"from": "http://new/s", "to": "http://tmp/s", "status": 302},
+]
+
+
+def test_permanent_prefix_stops_at_temporary_redirect():
+    assert RedirectCache.permanent_prefix(HOPS) == HOPS[:2]
+    assert RedirectCache.permanent_prefix(HOPS[2:] + HOPS[:2]) == []
+
+
+def test_store_lookup_invalidate():
+    cache = RedirectCache(ttl=60)
+    entry = cache.store("http://old/s", HOPS)
+    assert entry["target"] == "http://new/s"
+    assert cache.lookup("http://old/s") is entry
+
+    # 开头没有永久跳转时删除旧条目
+    assert cache.store("http://old/s", HOPS[2:]) is None
+    assert cache.lookup("http://old/s") is None
+
+    cache.store("http://old/s", HOPS)
+    cache.invalidate("http://old/s")
+    assert cache.lookup("http://old/s") is None
+
+
+def test_expired_entries_dropped():
+    cache = RedirectCache(ttl=60)
+    cache.store("http://old/s", HOPS)
+    cache._entries["http://old/s"]["expires"] = time.time() - 1
+    assert cache.to_dict() == {}
+    assert cache.lookup("http://old/s") is None
+
+    persisted = {"http://a": {"target": "http://b", "chain": [], "expires": time.time() + 60},
+                 "http://c": {"target": "http://d", "chain": [], "expires": time.time() - 1},
+                 "http://e": "broken"}
+    assert set(RedirectCache(entries=persisted).to_dict()) == {"http://a"}
@@ -0,0 +1,27 @@
+"""配置热加载测试"""
+import json
+
+
+def test_reload_keeps_config_on_invalid_file(make_monitor):
+    monitor = make_monitor()
+    config = monitor.config
+    monitor.config_file.write_text('{not json', encoding='utf-8')
+
+    assert monitor.reload_config() is False
+    assert monitor.config is config
+
+
+def test_reload_rebuilds_prober_only_on_probe_changes(make_monitor):
+    monitor = make_monitor()
+    prober = monitor.prober
+    config = json.loads(monitor.config_file.read_text(encoding='utf-8'))
+
+    monitor.config_file.write_text(json.dumps(config), encoding='utf-8')
+    assert monitor.reload_config() is True
+    assert monitor.prober is prober
+
+    config['url_tester']['test_timeout'] = config['url_tester'].get('test_timeout', 15) + 5
+    monitor.config_file.write_text(json.dumps(config), encoding='utf-8')
+    assert monitor.reload_config() is True
+    assert monitor.prober is not prober
+    assert monitor.prober.options.timeout == config['url_tester']['test_timeout']
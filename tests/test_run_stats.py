@@ -0,0 +1,40 @@
+"""运行性能统计测试"""
+import pytest
+
+from pan_site_monitor import RunStats
+
+
+def test_stages_accumulate_and_probe_distribution():
+    stats = RunStats()
+    for _ in range(2):
+        with stats.stage("probe"):
+            pass
+    with pytest.raises(RuntimeError):
+        with stats.stage("rank"):
+            raise RuntimeError("失败的阶段也计时")
+    assert stats.probe_distribution() is None
+
+    for seconds in (0.4, 0.1, 0.3, 0.2):
+        stats.record_probe(seconds)
+    result = stats.to_dict()
+
+    assert result["stages"]["probe"]["count"] == 2
+    assert result["stages"]["rank"]["count"] == 1
+    assert result["probes"]["count"] == 4
+    assert result["probes"]["p50"] == pytest.approx(0.25)
+    assert result["probes"]["mean"] == pytest.approx(0.25)
+    assert result["probes"]["max"] == 0.4
+
+
+def test_profiled_writes_merged_profile(tmp_path):
+    assert RunStats().profiled(sum, [1, 2]) == 3
+    assert RunStats().save_profile() is None
+
+    output = tmp_path / "profile" / "probe.prof"
+    stats = RunStats(str(output))
+    assert stats.profiled(sorted, [3, 1, 2]) == [1, 2, 3]
+    assert stats.profiled(sum, [1, 2]) == 3
+
+    text = stats.save_profile(top=5)
+    assert output.exists()
+    assert "sorted" in text
@@ -0,0 +1,56 @@
+"""多次采样测试"""
+import time
+
+import pytest
+
+from mirror_simulator import MirrorSimulator, SEARCH_PATH, KEYWORD
+from pan_site_monitor import ProbeOptions, Prober, ProbeTarget, summarize_samples
+
+
+@pytest.fixture(scope="module")
+def simulator():
+    with MirrorSimulator(ttfb_delay=0.5, enable_https=False) as sim:
+        yield sim
+
+
+def test_summarize_samples():
+    stats = summarize_samples([0.3, 0.1, 0.2, 5.0], 'median')
+    assert stats['samples'] == 4
+    assert stats['latency'] == pytest.approx(0.25)
+    trimmed = summarize_samples([0.1, 0.2, 0.3, 0.4, 9.0], 'trimmed_mean', 0.2)
+    assert trimmed['latency'] == pytest.approx(0.3)
+
+
+def test_single_sample_by_default(simulator):
+    assert ProbeOptions().samples == 1
+    prober = Prober(ProbeOptions(rate=0, liveness_check=False))
+    before = sum(simulator.request_counts().values())
+    result = prober.measure(ProbeTarget(simulator.mirror_url('fast', 'single'), search_path=SEARCH_PATH,
+                                        keyword=KEYWORD))
+    assert result.ok
+    assert sum(simulator.request_counts().values()) - before == 1
+
+
+def test_extra_samples_run_concurrently(simulator):
+    prober = Prober(ProbeOptions(rate=0, samples=3, spread=0, liveness_check=False))
+    target = ProbeTarget(simulator.mirror_url('slow_ttfb', 'sampled'), search_path=SEARCH_PATH, keyword=KEYWORD)
+    start = time.perf_counter()
+    result = prober.measure(target)
+    elapsed = time.perf_counter() - start
+    assert result.ok
+    assert result.stats['samples'] == 3
+    # 首次探测 0.5s + 两次并发补充采样 0.5s；顺序采样至少需要 1.5s
+    assert elapsed < 1.4
+
+
+def test_best_url_hysteresis(make_monitor):
+    monitor = make_monitor()
+    monitor.config['url_tester']['health']['rank_by'] = 'latency'
+    monitor.config['url_tester']['sampling']['switch_margin'] = 0.1
+    monitor._previous_best_urls = {'A': 'http://incumbent'}
+
+    # 挑战者只快5%，保留现任；快20%时替换
+    assert monitor._select_best_url('A', {'http://incumbent': 0.20, 'http://challenger': 0.19}) == 'http://incumbent'
+    assert monitor._select_best_url('A', {'http://incumbent': 0.20, 'http://challenger': 0.16}) == 'http://challenger'
+    # 现任失效时直接选最快的
+    assert monitor._select_best_url('A', {'http://challenger': 0.19, 'http://other': 0.3}) == 'http://challenger'
@@ -0,0 +1,52 @@
+"""JSON序列化后端一致性测试"""
+import io
+import json
+
+import pytest
+
+from pan_site_monitor import ORJSON_AVAILABLE, JsonSerializer
+
+BACKENDS = ['stdlib'] + (['orjson'] if ORJSON_AVAILABLE else [])
+
+DOCUMENT = {
+    "站点": "仙台有树",
+    "floats": [0.0, 1.5, -2.25, 1e-05, 0.0001, 0.00012345, 1.2345e-07, 1e16, -3.5e20, 123456789.125],
+    "nested": {"latency": 1e-05, "text": "0.00001 1e16", "empty": {}, "list": []},
+    "ints": [0, -1, 2 ** 63 - 1],
+    "flags": [True, False, None],
+}
+
+
+def _expected(value) -> bytes:
+    return json.dumps(value, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_dumps_indented_matches_stdlib(backend):
+    serializer = JsonSerializer(backend)
+    assert serializer.backend == backend
+    assert serializer.dumps_indented(DOCUMENT) == _expected(DOCUMENT)
+    # orjson 不支持的值回退到标准库
+    fallback = {1: "非字符串键", "big": 2 ** 70}
+    assert serializer.dumps_indented(fallback) == _expected(fallback)
+    assert serializer.dumps_indented({"a": [1e-05]}, level=1) == _expected({"a": [1e-05]}).replace(b'\n', b'\n  ')
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_write_document_matches_merged_dumps(backend, tmp_path):
+    serializer = JsonSerializer(backend)
+    head = {"timestamp": "2024-01-01T00:00:00", "summary": {"sites": 2}}
+    sections = {"history": {"A": {"http://a1": [{"latency": 1e-05}]}, "B": {}}, "empty": {}}
+
+    buffer = io.BytesIO()
+    serializer.write_document(buffer, head, sections)
+    assert buffer.getvalue() == _expected({**head, **sections})
+
+    buffer = io.BytesIO()
+    serializer.write_document(buffer, {}, {})
+    assert buffer.getvalue() == b'{}'
+
+    path = tmp_path / "document.json"
+    path.write_bytes(_expected({**head, **sections}))
+    assert serializer.load_file(path) == {**head, **sections}
+    assert serializer.loads(path.read_bytes()) == {**head, **sections}
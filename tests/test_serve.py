@@ -0,0 +1,39 @@
+"""serve 命令数据响应测试"""
+import gzip
+import json
+
+from pan_site_monitor import PanSiteMonitor, ServedPayload
+
+
+def test_served_payload():
+    body = json.dumps({"x": list(range(500))}).encode('utf-8')
+    payload = ServedPayload(body)
+    assert payload.etag == ServedPayload(body).etag
+    assert payload.etag != ServedPayload(body + b' ').etag
+    assert gzip.decompress(payload.gzip_body) == body
+    assert payload.gzip_etag != payload.etag
+    assert ServedPayload(b'{}').gzip_body is None
+
+
+def test_accept_encoding_and_etag():
+    assert PanSiteMonitor._accepts_gzip('gzip, deflate, br')
+    assert PanSiteMonitor._accepts_gzip('*')
+    assert not PanSiteMonitor._accepts_gzip('gzip;q=0, deflate')
+    assert not PanSiteMonitor._accepts_gzip('')
+    assert PanSiteMonitor._etag_matches('W/"abc", "def"', '"abc"')
+    assert PanSiteMonitor._etag_matches('*', '"abc"')
+    assert not PanSiteMonitor._etag_matches('"abd"', '"abc"')
+
+
+def test_build_served_routes(make_monitor):
+    monitor = make_monitor()
+    snapshot = {"seq": 3, "sites": {"A": {"best_url": "http://a1"}},
+                "history": {"A": {"http://a1": [{"status": "up"}]}}}
+    routes = monitor.build_served_data(json.dumps(snapshot).encode('utf-8'), b'{"seq":3}', b'{"format":"t"}')
+
+    assert routes['/api/data'] is routes['/assets/data/monitor_data.json']
+    assert routes['/api/delta'].body == b'{"seq":3}'
+    assert routes['/api/trends'].body == b'{"format":"t"}'
+    assert json.loads(routes['/api/data/sites/A'].body) == {"best_url": "http://a1"}
+    assert json.loads(routes['/api/history/A'].body) == {"http://a1": [{"status": "up"}]}
+    assert '/api/trends' not in monitor.build_served_data(b'{}')
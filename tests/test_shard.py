@@ -0,0 +1,52 @@
+"""分片探测与合并测试"""
+import json
+
+import pytest
+
+from pan_site_monitor import ProbeResult
+
+SITE_URLS = {f"site{index}": [f"http://s{index}-m{mirror}" for mirror in range(4)] for index in range(6)}
+
+
+@pytest.mark.parametrize("by", ["url", "site"])
+def test_shards_partition_urls(make_monitor, by):
+    monitor = make_monitor(SITE_URLS)
+    shards = [monitor.select_assignment(SITE_URLS, index, 3, by) for index in range(3)]
+
+    seen = [(site_name, url) for shard in shards for site_name, urls in shard.items() for url in urls]
+    assert sorted(seen) == sorted((site_name, url) for site_name, urls in SITE_URLS.items() for url in urls)
+    if by == 'site':
+        assert all(shard[site_name] == SITE_URLS[site_name] for shard in shards for site_name in shard)
+    assert monitor.select_assignment(SITE_URLS, 0, 1, by) == SITE_URLS
+
+
+def _write_shard(monitor, index, count, timestamp=None):
+    assignment = monitor.select_assignment(SITE_URLS, index, count)
+    results = {site_name: {'best_url': None, 'url_results': {
+        url: ProbeResult(url, site_name, 0.1 + int(url[-1]) / 10, True) for url in urls}}
+        for site_name, urls in assignment.items()}
+    document = monitor.export_probe_results(results, 'default', f"shard-{index}", shard=f"{index}/{count}")
+    if timestamp:
+        document["timestamp"] = timestamp
+    shard_dir = monitor._shard_output_dir()
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    (shard_dir / f"shard-{index}.json").write_text(json.dumps(document), encoding='utf-8')
+
+
+def test_merge_requires_all_shards(make_monitor):
+    monitor = make_monitor(SITE_URLS)
+    _write_shard(monitor, 0, 2)
+    assert monitor.run_merge() == {}
+    assert len(monitor.run_merge(allow_partial=True)) > 0
+
+    _write_shard(monitor, 1, 2)
+    results = monitor.run_merge()
+    assert list(results) == list(SITE_URLS)
+    assert all(result['best_url'] == SITE_URLS[site_name][0] for site_name, result in results.items())
+
+
+def test_merge_ignores_stale_shards(make_monitor):
+    monitor = make_monitor(SITE_URLS)
+    _write_shard(monitor, 0, 2)
+    _write_shard(monitor, 1, 2, timestamp="2000-01-01T00:00:00")
+    assert monitor.run_merge() == {}
@@ -0,0 +1,34 @@
+"""自适应超时测试"""
+import time
+
+from pan_site_monitor import ProbeOptions, Prober, ProbeTarget
+
+
+def _records(latencies):
+    return [{"status": "up", "latency": latency} for latency in latencies] + [{"status": "down", "latency": None}]
+
+
+def test_compute_url_timeouts(make_monitor):
+    monitor = make_monitor(url_tester={"adaptive_timeout": {
+        "enabled": True, "percentile": 0.5, "multiplier": 3, "floor": 2, "ceiling": 15, "min_samples": 3}})
+    history = {"A": {
+        "http://fast": _records([0.1, 0.2, 0.3]),
+        "http://mid": _records([1.0, 1.2, 1.4]),
+        "http://slow": _records([9, 10, 11]),
+        "http://few": _records([0.5]),
+    }, "B": None}
+
+    timeouts = monitor._compute_url_timeouts(history)
+
+    assert timeouts == {"A": {"http://fast": 2, "http://mid": 3.6, "http://slow": 15}}
+
+
+def test_attempt_timeout_clamped_by_deadline():
+    prober = Prober(ProbeOptions(timeout=10, min_timeout=2))
+    assert prober._attempt_timeout(ProbeTarget('http://a')) == 10
+    assert prober._attempt_timeout(ProbeTarget('http://a', timeout=3)) == 3
+
+    prober.deadline = time.monotonic() + 5
+    assert 4 < prober._attempt_timeout(ProbeTarget('http://a')) <= 5
+    prober.deadline = time.monotonic() + 1
+    assert prober._attempt_timeout(ProbeTarget('http://a')) is None
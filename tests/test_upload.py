@@ -0,0 +1,19 @@
+"""GitHub上传文件列表测试"""
+
+
+def test_missing_optional_file_is_skipped(make_monitor):
+    monitor = make_monitor()
+    monitor.config['github'].update({'owner': 'octo', 'repo': 'monitor', 'token': 'token-1234567890'})
+    monitor.config['github']['files_to_upload'] = [
+        {'local_path': 'data/test.json', 'github_path': 'data/test.json'},
+        {'local_path': 'web/assets/data/monitor_trends.json', 'github_path': 'trends.json', 'optional': True},
+    ]
+    uploaded = []
+    monitor.upload_file_to_github = lambda local_path, github_path: uploaded.append(local_path) or True
+
+    assert monitor.run_github_uploader() is True
+    assert uploaded == ['data/test.json']
+
+    monitor.config['github']['files_to_upload'][1]['optional'] = False
+    monitor.upload_file_to_github = lambda local_path, github_path: (monitor.base_dir / local_path).exists()
+    assert monitor.run_github_uploader() is False
@@ -7,6 +7,9 @@ import { CONFIG } from '../config.js';
 import { state } from '../state.js';
 
 export const loader = {
+    // 完整数据的来源（api 或 file），增量数据使用对应的路径
+    dataSource: null,
+
     syncHistoryData(historyData) {
         state.siteHistoryData = historyData || {};
         if (typeof window !== 'undefined') {
@@ -38,6 +41,7 @@ export const loader = {
         try {
             console.log('🔄 尝试从API加载数据...');
             const data = await this.fetchJson('/api/data', 'API');
+            this.dataSource = 'api';
             console.log('✅ 成功从API加载数据');
             return data;
         } catch (apiError) {
@@ -46,6 +50,7 @@ export const loader = {
             try {
                 console.log('🔄 尝试从本地合并文件加载数据...');
                 const data = await this.fetchJson('./assets/data/monitor_data.json', 'Monitor file');
+                this.dataSource = 'file';
                 console.log('✅ 成功从本地合并文件加载数据');
                 return data;
             } catch (monitorError) {
@@ -54,6 +59,173 @@ export const loader = {
         }
     },
 
+    // 获取最近一次运行的增量文档
+    async fetchDelta() {
+        const url = this.dataSource === 'api' ? '/api/delta' : './assets/data/monitor_delta.json';
+        // no-cache：每次向服务器验证，未变化时只返回304
+        const response = await fetch(url, { cache: 'no-cache' });
+
+        if (!response.ok) {
+            throw new Error(`Delta HTTP ${response.status}`);
+        }
+
+        return response.json();
+    },
+
+    // 将增量文档应用到完整数据上（与后端 build_snapshot/update_history 的结果保持一致）
+    applyDelta(data, delta) {
+        const limit = delta.history_limit || CONFIG.HISTORY_LENGTH;
+        const previousSites = data.sites || {};
+        const sites = {};
+
+        data.seq = delta.seq;
+        data.timestamp = delta.timestamp;
+        data.summary = delta.summary;
+        data.history = data.history || {};
+
+        Object.entries(delta.sites || {}).forEach(([siteName, siteDelta]) => {
+            const siteData = previousSites[siteName] || { site_name: siteName, urls: [] };
+            const siteHistory = data.history[siteName] || (data.history[siteName] = {});
+            siteData.best_url = siteDelta.best_url;
+            siteData.status = siteDelta.status;
+
+            // 本次未探测的站点没有数据点，保留原有URL状态
+            if (!siteDelta.up) {
+                (siteData.urls || []).forEach(urlData => {
+                    urlData.is_best = urlData.url === siteDelta.best_url;
+                });
+                sites[siteName] = siteData;
+                return;
+            }
+
+            const urlMap = new Map((siteData.urls || []).map(urlData => [urlData.url, urlData]));
+            const points = [
+                ...Object.entries(siteDelta.up || {}).map(([url, latency]) => [url, latency, null, 'up']),
+                ...Object.entries(siteDelta.down || {}).map(([url, errorDetail]) => [url, null, errorDetail, 'down']),
+                ...Object.entries(siteDelta.not_measured || {}).map(([url, detail]) => [url, null, detail, 'not_measured'])
+            ];
+
+            siteData.urls = points.map(([url, latency, errorDetail, status]) => {
+                const isBest = url === siteDelta.best_url;
+                const jitter = siteDelta.jitter && url in siteDelta.jitter ? siteDelta.jitter[url] : null;
+
+                // 追加历史数据点，超出保留数量时丢弃最旧的
+                const record = {
+                    timestamp: delta.point_time,
+                    status: status,
+                    latency: latency,
+                    is_best: isBest
+                };
+                if (errorDetail) record.error_detail = errorDetail;
+                if (jitter !== null) record.jitter = jitter;
+                const series = siteHistory[url] || (siteHistory[url] = []);
+                series.push(record);
+                if (series.length > limit) {
+                    series.splice(0, series.length - limit);
+                }
+
+                // 更新当前状态
+                const urlData = urlMap.get(url) || { url: url };
+                urlData.latency = latency !== null ? Math.round(latency * 100) / 100 : null;
+                urlData.has_keyword = latency !== null;
+                urlData.is_best = isBest;
+                delete urlData.error_marker;
+                if (status === 'not_measured') {
+                    urlData.error_type = status;
+                } else {
+                    delete urlData.error_type;
+                }
+                if (errorDetail) {
+                    urlData.error_detail = errorDetail;
+                } else {
+                    delete urlData.error_detail;
+                }
+                if (jitter !== null) {
+                    urlData.latency_stats = { ...(urlData.latency_stats || {}), jitter: jitter };
+                } else {
+                    delete urlData.latency_stats;
+                }
+                return urlData;
+            });
+
+            // 最佳URL在前，失败的URL排在最后
+            siteData.urls.sort((a, b) =>
+                (b.is_best - a.is_best) ||
+                ((a.latency === null) - (b.latency === null)) ||
+                ((a.latency || 999) - (b.latency || 999)));
+            sites[siteName] = siteData;
+        });
+
+        // 清理后端已删除的URL和站点
+        Object.entries(delta.removed || {}).forEach(([siteName, urls]) => {
+            const siteHistory = data.history[siteName];
+            if (!siteHistory) return;
+            urls.forEach(url => delete siteHistory[url]);
+            if (Object.keys(siteHistory).length === 0) {
+                delete data.history[siteName];
+            }
+        });
+
+        data.sites = sites;
+        return data;
+    },
+
+    // 渲染数据并记录为当前状态
+    showData(data) {
+        state.monitorData = data;
+        if (typeof window !== 'undefined' && window.renderSites) {
+            window.renderSites(data);
+        }
+    },
+
+    // 增量刷新：序号连续时应用增量，出现序号跳跃时重新加载完整数据
+    async refresh() {
+        const current = state.monitorData;
+        if (!current) return;
+
+        let delta = null;
+        try {
+            delta = await this.fetchDelta();
+        } catch (err) {
+            console.warn('⚠️ 增量数据加载失败，保留当前数据:', err.message);
+            return;
+        }
+
+        // 没有新数据，或增量比当前数据还旧（缓存未更新）
+        if (typeof delta.seq !== 'number' || (typeof current.seq === 'number' && delta.seq <= current.seq)) {
+            return;
+        }
+
+        if (delta.seq === current.seq + 1) {
+            this.applyDelta(current, delta);
+            this.syncHistoryData(current.history);
+            this.showData(current);
+            console.log(`✅ 已应用增量数据 seq=${delta.seq}`);
+            return;
+        }
+
+        console.log(`🔄 增量序号不连续 (${current.seq} -> ${delta.seq})，重新加载完整数据`);
+        try {
+            this.showData(await this.fetchDataFromSources());
+        } catch (err) {
+            console.warn('⚠️ 完整数据重新加载失败:', err.message);
+        }
+    },
+
+    // 启动增量轮询
+    startDeltaPolling() {
+        this.stopDeltaPolling();
+        state.deltaTimer = setInterval(() => this.refresh(), CONFIG.DELTA_POLL_INTERVAL);
+    },
+
+    // 停止增量轮询
+    stopDeltaPolling() {
+        if (state.deltaTimer) {
+            clearInterval(state.deltaTimer);
+            state.deltaTimer = null;
+        }
+    },
+
     // 处理加载错误
     handleLoadError(err, errorDetails, loading) {
         const errorInfo = errorDetails || {
@@ -100,10 +272,10 @@ export const loader = {
 
             if (data) {
                 // 需要从renderer模块导入renderSites函数
-                if (typeof window !== 'undefined' && window.renderSites) {
-                    window.renderSites(data);
-                }
+                this.showData(data);
                 loading.style.display = 'none';
+                // 之后只拉取增量数据
+                this.startDeltaPolling();
             }
 
         } catch (err) {
@@ -17,6 +17,7 @@ export const renderer = {
             status: 'no_data',
             timestamp: '',
             latency: null,
+            jitter: null,
             errorDetail: null
         }));
 
@@ -50,6 +51,7 @@ export const renderer = {
                     status: record.status,
                     timestamp: formattedTime,
                     latency: record.latency,
+                    jitter: record.jitter || null,
                     errorDetail: record.error_detail || null
                 };
             });
@@ -76,9 +78,11 @@ export const renderer = {
             });
 
             const currentStatus = {
-                status: currentUrlData.latency ? 'success' : 'down',
+                status: currentUrlData.latency ? 'success' :
+                        currentUrlData.error_type === 'not_measured' ? 'not_measured' : 'down',
                 timestamp: currentTime,
                 latency: currentUrlData.latency,
+                jitter: currentUrlData.latency_stats ? currentUrlData.latency_stats.jitter : null,
                 errorDetail: currentUrlData.error_detail || null
             };
 
@@ -124,11 +128,13 @@ export const renderer = {
     createStatusHistoryHTML(statusHistory) {
         return statusHistory.map((item, historyIndex) => {
             const statusLabel = item.status === 'success' || item.status === 'up' ? '在线' :
-                              item.status === 'no_data' ? '无数据' : '离线';
+                              item.status === 'no_data' ? '无数据' :
+                              item.status === 'not_measured' ? '未测量' : '离线';
             return `<div class="status-dot ${item.status}"
                         data-time="${utils.sanitizeHTML(item.timestamp)}"
                         data-status="${utils.sanitizeHTML(item.status)}"
                         data-latency="${item.latency ? (item.latency * 1000).toFixed(0) : ''}"
+                        data-jitter="${item.jitter ? (item.jitter * 1000).toFixed(0) : ''}"
                         data-error-detail="${item.errorDetail ? utils.sanitizeHTML(item.errorDetail) : ''}"
                         role="img"
                         aria-label="历史状态点 ${historyIndex + 1}: ${statusLabel}${item.timestamp ? ', 时间: ' + item.timestamp : ''}">
@@ -180,8 +186,11 @@ export const renderer = {
         // 确定显示文本
         const displayText = headerDisplayUrl ? utils.sanitizeHTML(headerDisplayUrl) : '暂无可用URL';
 
+        // 运行期限内未能探测的站点不标记为离线
+        const notMeasured = siteData.status === 'not_measured';
+
         return `
-            <div class="status-indicator failed" role="img" aria-label="站点离线"></div>
+            <div class="status-indicator ${notMeasured ? 'not_measured' : 'failed'}" role="img" aria-label="${notMeasured ? '站点未测量' : '站点离线'}"></div>
             <div class="site-info">
                 <div class="site-name" id="site-name-${index}">${utils.sanitizeHTML(siteName)}</div>
                 <div class="best-url failed-url">${displayText}</div>
@@ -239,7 +248,8 @@ export const renderer = {
     // 创建URL项目HTML
     createUrlItemHTML(siteName, urlData, index) {
         const statusHistory = this.generateStatusHistory(siteName, urlData.url, urlData);
-        const statusIndicatorClass = urlData.latency ? 'success' : 'failed';
+        const statusIndicatorClass = urlData.latency ? 'success' :
+                                     urlData.error_type === 'not_measured' ? 'not_measured' : 'failed';
 
         return `
         <div class="url-item">
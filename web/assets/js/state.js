@@ -5,6 +5,8 @@
 
 export const state = {
     siteHistoryData: {},
+    monitorData: null,  // 当前完整数据（含seq），增量更新在此基础上应用
+    deltaTimer: null,
     countdownTimer: null,
     tooltipMouseMoveActive: false,
     tooltip: null
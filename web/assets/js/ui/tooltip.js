@@ -62,11 +62,12 @@ export const tooltip = {
         const time = dot.dataset.time;
         const status = dot.dataset.status;
         const latency = dot.dataset.latency;
+        const jitter = dot.dataset.jitter;
         const errorDetail = dot.dataset.errorDetail;
 
         // 如果有时间数据，则显示工具提示
         if (time || status === 'no_data') {
-            const tooltipText = this.generateTooltipText(status, time, latency, errorDetail);
+            const tooltipText = this.generateTooltipText(status, time, latency, errorDetail, jitter);
 
             this.element.innerHTML = tooltipText;
             this.element.style.display = 'block';
@@ -102,13 +103,15 @@ export const tooltip = {
     },
 
     // 生成工具提示文本
-    generateTooltipText(status, time, latency, errorDetail) {
+    generateTooltipText(status, time, latency, errorDetail, jitter) {
         if (status === 'no_data') {
             return '无历史数据';
         }
 
-        // 状态文本
-        const statusText = (status === 'up' || status === 'success') ? '在线' : '离线';
+        // 状态文本（运行期限内未测量的数据点单独显示）
+        const online = status === 'up' || status === 'success';
+        const statusText = online ? '在线' : status === 'not_measured' ? '未测量' : '离线';
+        const statusClass = online ? 'status-online' : status === 'not_measured' ? 'status-unmeasured' : 'status-offline';
 
         // 处理时间格式，去掉秒数
         let simplifiedTime = time;
@@ -124,11 +127,15 @@ export const tooltip = {
         }
 
         // 组装简洁的单行提示
-        let tooltipText = `<span class="${status === 'up' || status === 'success' ? 'status-online' : 'status-offline'}">${statusText}</span> - ${simplifiedTime}`;
+        let tooltipText = `<span class="${statusClass}">${statusText}</span> - ${simplifiedTime}`;
 
         // 如果有延迟数据则添加（绿色显示）
         if (latency && (status === 'up' || status === 'success')) {
             tooltipText += ` - <span class="latency-text">${latency}ms</span>`;
+            // 多次采样时显示抖动（标准差）
+            if (jitter) {
+                tooltipText += ` <span class="jitter-text">±${jitter}ms</span>`;
+            }
         }
 
         // 如果有错误详情且状态为离线，则添加错误详情（红色显示）